@@ -1,25 +1,48 @@
 import os
-import json
+import sqlite3
 import uuid
 import re
-from datetime import datetime
+import shutil
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import orjson
 from dotenv import load_dotenv
 from flask import Flask, request, jsonify
-from flask_mail import Mail, Message
+from flask.json.provider import JSONProvider
+from flask_mail import Connection, Mail, Message
 from flask_cors import CORS
+from celery import Celery
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 from email.mime.image import MIMEImage
 import logging
 
 # --- Configure logging to see detailed errors ---
 logging.basicConfig(level=logging.INFO)
+
+
+class ORJSONProvider(JSONProvider):
+    """Serves jsonify() and request.json through orjson instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # --- Load environment variables ---
 load_dotenv()
 
 # IMPORTANT: In a production environment, set specific origins (e.g., your domain: "https://www.yourdomain.com")
-CORS(app, origins="https://in-growwth-innovations-uqml.vercel.app/")  # Enables Cross-Origin Resource Sharing
+# FRONTEND_ORIGIN accepts a comma-separated list. Browsers cache the preflight response for a day (max_age).
+FRONTEND_ORIGINS = os.getenv('FRONTEND_ORIGIN', 'https://in-growwth-innovations-uqml.vercel.app').split(',')
+CORS(app, origins=[origin.strip() for origin in FRONTEND_ORIGINS], max_age=86400, supports_credentials=False)  # Enables Cross-Origin Resource Sharing
 
 # --- Email configuration from environment variables ---
 # NOTE: If you are using Gmail, you MUST use a specific "App Password" instead of your regular
@@ -35,78 +58,249 @@ app.config['MAIL_DEFAULT_SENDER'] = os.getenv('SENDER_EMAIL')
 
 mail = Mail(app)
 
+# Resolved once; read on every form submission
+_DEFAULT_SENDER = app.config['MAIL_DEFAULT_SENDER']
+_RECEIVER_EMAIL = os.getenv('RECEIVER_EMAIL')
+
+# --- Background email delivery (emails are sent after the response, not during the request) ---
+# With CELERY_BROKER_URL set, a Celery worker sends them; run it alongside the web process:
+#   celery -A Backend.app.celery worker --concurrency=8
+# Without a broker, they go through an in-process send queue instead: a single thread, since
+# all mail in a process shares one SMTP session and is sent one message at a time anyway.
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
+celery = Celery(app.name, broker=CELERY_BROKER_URL)
+_MAIL_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Failed emails are retried the same way on both paths
+MAIL_MAX_RETRIES = 3
+MAIL_RETRY_DELAY = 30  # seconds
+
 # --- Folders for data & uploads ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 RESUMES_FOLDER = os.path.join(BASE_DIR, 'resumes')
-APPLICATIONS_DB = os.path.join(BASE_DIR, 'applications.json')
+APPLICATIONS_DB = os.path.join(BASE_DIR, 'applications.db')
+LEGACY_APPLICATIONS_JSON = os.path.join(BASE_DIR, 'applications.json')
 TEMPLATES_FOLDER = os.path.join(BASE_DIR, 'templates')
 ASSETS_FOLDER = os.path.join(BASE_DIR, 'assets', 'images')
+REPLY_TEMPLATE_PATH = os.path.join(TEMPLATES_FOLDER, 'reply_email.html')
+LOGO_PATH = os.path.join(ASSETS_FOLDER, 'company_logo.png')
+
+# Validation patterns for the application form
+_EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]{2,}$')
+_PHONE_RE = re.compile(r'^[6-9]\d{9}$')
+
+# Upload limits: cap the request body and copy resumes to disk in 1 MB chunks
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1 << 20
+ALLOWED_RESUME_EXTENSIONS = {'.pdf', '.doc', '.docx'}
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE
 
 os.makedirs(RESUMES_FOLDER, exist_ok=True)
 os.makedirs(os.path.join(TEMPLATES_FOLDER), exist_ok=True)
 
+# --- Email assets (read once; they never change while the process is running) ---
+with open(REPLY_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+    _REPLY_TEMPLATE = f.read()
+# Matches only the known placeholders, so the template's CSS braces are left alone
+_REPLY_PLACEHOLDER_RE = re.compile(r'\{(first_name|last_name|role_name)\}')
+
+_LOGO_BYTES = None
+if os.path.exists(LOGO_PATH):
+    with open(LOGO_PATH, 'rb') as f:
+        _LOGO_BYTES = f.read() or None
+if _LOGO_BYTES is None:
+    app.logger.error(f"Failed to find or read company logo at path: {LOGO_PATH}. Career emails will be sent without logo.")
+
+# The logo's MIME part (headers + base64 body) is built once and shared by every career email
+_LOGO_MIME = None
+if _LOGO_BYTES is not None:
+    _LOGO_MIME = MIMEImage(_LOGO_BYTES, _subtype='png')
+    _LOGO_MIME.add_header('Content-ID', '<company_logo>')
+    _LOGO_MIME.add_header('Content-Disposition', 'inline', filename='company_logo.png')
+
+# --- Applications database (SQLite in WAL mode: O(1) appends, safe across workers) ---
+APPLICATION_COLUMNS = (
+    'id', 'date', 'firstName', 'lastName', 'email', 'phone', 'workExp',
+    'applyingFor', 'github', 'linkedin', 'intro', 'resume_path'
+)
+INSERT_APPLICATION_SQL = (
+    f"INSERT INTO applications ({', '.join(APPLICATION_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in APPLICATION_COLUMNS)})"
+)
+# Legacy import: rows already present (same id) are skipped. Imported records keep their original
+# formats: dashed UUID ids and naive local-time dates, unlike the hex ids and UTC dates of new rows.
+IMPORT_APPLICATION_SQL = (
+    f"INSERT OR IGNORE INTO applications ({', '.join(APPLICATION_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in APPLICATION_COLUMNS)})"
+)
+
+# Long-lived connection used for inserts, opened lazily in each worker process
+_db_conn = None
+_db_lock = threading.Lock()
+
+
+def get_db():
+    """Opens a connection to the applications database."""
+    conn = sqlite3.connect(APPLICATIONS_DB, check_same_thread=False)
+    # Safe with WAL: commits survive an application crash without an fsync per insert
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+def _import_legacy_applications(conn):
+    """Copies records from the old applications.json file; a bad file is logged, never fatal."""
+    try:
+        with open(LEGACY_APPLICATIONS_JSON, 'rb') as f:
+            applications = orjson.loads(f.read())
+        rows = [{column: record.get(column) for column in APPLICATION_COLUMNS} for record in applications]
+        # Savepoint keeps the import all-or-nothing
+        conn.execute('SAVEPOINT legacy_import')
+        try:
+            imported = conn.executemany(IMPORT_APPLICATION_SQL, rows).rowcount
+        except sqlite3.Error:
+            conn.execute('ROLLBACK TO legacy_import')
+            raise
+        finally:
+            conn.execute('RELEASE legacy_import')
+        app.logger.info(f"Imported {imported} of {len(rows)} applications from {LEGACY_APPLICATIONS_JSON}.")
+    except Exception as e:
+        app.logger.error(f"Failed to import applications from {LEGACY_APPLICATIONS_JSON}: {e}")
+
+
+def init_db():
+    """Creates the applications table and imports records from the old applications.json file."""
+    conn = get_db()
+    conn.isolation_level = None
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        # Every worker runs this at startup; taking the write lock before the emptiness check
+        # means only the first one to get here imports the legacy file.
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS applications ('
+                'id TEXT PRIMARY KEY, '
+                + ', '.join(f'{column} TEXT' for column in APPLICATION_COLUMNS[1:])
+                + ')'
+            )
+            is_empty = conn.execute('SELECT 1 FROM applications LIMIT 1').fetchone() is None
+            if is_empty and os.path.exists(LEGACY_APPLICATIONS_JSON) and os.path.getsize(LEGACY_APPLICATIONS_JSON) > 0:
+                _import_legacy_applications(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.close()
+
+init_db()
+
+# --- Pooled SMTP connection ---
+# Each worker process keeps one authenticated SMTP session and reuses it for every message,
+# so the STARTTLS + AUTH handshake is paid once instead of per email.
+SMTP_TIMEOUT = 30  # seconds; a stalled server must not block mail delivery forever
+
+
+class TimeoutConnection(Connection):
+    """Flask-Mail connection whose SMTP socket times out from the TCP connect onwards, not just after login."""
+
+    def configure_host(self):
+        if self.mail.use_ssl:
+            host = smtplib.SMTP_SSL(self.mail.server, self.mail.port, timeout=SMTP_TIMEOUT)
+        else:
+            host = smtplib.SMTP(self.mail.server, self.mail.port, timeout=SMTP_TIMEOUT)
+
+        host.set_debuglevel(int(self.mail.debug))
+
+        if self.mail.use_tls:
+            host.starttls()
+
+        if self.mail.username and self.mail.password:
+            host.login(self.mail.username, self.mail.password)
+
+        return host
+
+
+_smtp_conn = TimeoutConnection(app.extensions['mail'])
+_smtp_lock = threading.Lock()
+
 # --- Helper functions ---
 
+def _open_smtp_host(conn):
+    """Replaces the SMTP session behind conn, closing the previous one first."""
+    if conn.host is not None:
+        conn.host.close()
+        conn.host = None
+    if not conn.mail.suppress:
+        conn.host = conn.configure_host()
+
+
+def _is_dropped_session(e):
+    """True if the error means the server closed our session (idle timeout, 421) rather than rejected the message."""
+    if isinstance(e, smtplib.SMTPResponseException):
+        return e.smtp_code == 421
+    if isinstance(e, smtplib.SMTPException):
+        return isinstance(e, smtplib.SMTPServerDisconnected)
+    return isinstance(e, OSError)
+
+
+def _send_mail(msg):
+    """Sends a message over the shared SMTP connection, reconnecting if the server dropped it."""
+    with _smtp_lock:
+        if _smtp_conn.host is None:
+            _open_smtp_host(_smtp_conn)
+        try:
+            _smtp_conn.send(msg)
+        except OSError as e:
+            if not _is_dropped_session(e):
+                raise
+            # Servers close idle sessions (usually with a 421); open a fresh one and retry once
+            _open_smtp_host(_smtp_conn)
+            _smtp_conn.send(msg)
+
 def save_application_data(data):
-    """Appends application data to a JSON file."""
+    """Inserts application data into the applications database."""
+    global _db_conn
     try:
-        if not os.path.exists(APPLICATIONS_DB) or os.path.getsize(APPLICATIONS_DB) == 0:
-            applications = []
-        else:
-            with open(APPLICATIONS_DB, 'r', encoding='utf-8') as f:
-                applications = json.load(f)
-        
-        applications.append(data)
-        
-        with open(APPLICATIONS_DB, 'w', encoding='utf-8') as f:
-            json.dump(applications, f, indent=4)
+        with _db_lock:
+            if _db_conn is None:
+                _db_conn = get_db()
+                # Autocommit: each INSERT is its own implicit transaction, no separate BEGIN/COMMIT
+                _db_conn.isolation_level = None
+            _db_conn.execute(INSERT_APPLICATION_SQL, data)
         return True
     except Exception as e:
         app.logger.error(f"Failed to save application data: {e}")
         return False
 
+class LogoMessage(Message):
+    """Message that embeds the pre-encoded company logo instead of base64-encoding it on every send."""
+
+    def _message(self):
+        msg = super()._message()
+        msg.attach(_LOGO_MIME)
+        return msg
+
+
 def send_career_reply_email(recipient, first_name, last_name, role_name):
-    msg = Message(
+    message_class = Message if _LOGO_MIME is None else LogoMessage
+    msg = message_class(
         subject=f"Application Received for {role_name} - InGrowwth Innovations!",
         recipients=[recipient],
-        sender=app.config['MAIL_DEFAULT_SENDER']
+        sender=_DEFAULT_SENDER
     )
 
     try:
-        # Read template
-        with open(os.path.join(TEMPLATES_FOLDER, 'reply_email.html'), 'r', encoding='utf-8') as f:
-            html_body = f.read()
-
-        # Update to replace all new placeholders
-        html_body = html_body.replace('{first_name}', first_name)
-        html_body = html_body.replace('{last_name}', last_name)
-        html_body = html_body.replace('{role_name}', role_name)
-
-        logo_path = os.path.join(ASSETS_FOLDER, 'company_logo.png')
-        if not os.path.exists(logo_path) or os.path.getsize(logo_path) == 0:
-            app.logger.error(f"Failed to find or read company logo at path: {logo_path}. Sending email without logo.")
-            msg.html = html_body
-            mail.send(msg)
-            app.logger.info(f"Confirmation email for career sent to {recipient} (no logo).")
-            return True
-
-        with open(logo_path, 'rb') as fp:
-            img_data = fp.read()
-
-        # Attach image properly for Flask-Mail: filename, content_type, data, headers=dict
-        msg.attach(
-            filename='company_logo.png',
-            content_type='image/png',
-            data=img_data,
-            headers={
-                'Content-ID': '<company_logo>',
-                'Content-Disposition': 'inline'
-            }
-        )
+        # Fill all placeholders in a single pass over the template
+        fields = {'first_name': first_name, 'last_name': last_name, 'role_name': role_name}
+        html_body = _REPLY_PLACEHOLDER_RE.sub(lambda m: fields[m.group(1)], _REPLY_TEMPLATE)
 
         msg.html = html_body
-        mail.send(msg)
-        app.logger.info(f"Confirmation email for career sent to {recipient}")
+        _send_mail(msg)
+        if _LOGO_MIME is None:
+            app.logger.info(f"Confirmation email for career sent to {recipient} (no logo).")
+        else:
+            app.logger.info(f"Confirmation email for career sent to {recipient}")
         return True
 
     except Exception as e:
@@ -119,7 +313,7 @@ def send_contact_reply_email(recipient, name, subject):
     msg = Message(
         subject=f"Inquiry Received: {subject} - InGrowwth Innovations",
         recipients=[recipient],
-        sender=app.config['MAIL_DEFAULT_SENDER']
+        sender=_DEFAULT_SENDER
     )
     
     msg.body = f"""
@@ -136,7 +330,7 @@ Best regards,
 The Team at InGrowwth Innovations
 """
     try:
-        mail.send(msg)
+        _send_mail(msg)
         app.logger.info(f"Confirmation email for contact sent to {recipient}")
         return True
     except Exception as e:
@@ -144,8 +338,93 @@ The Team at InGrowwth Innovations
         return False
 
 
+def send_company_notification_email(name, email, subject, message):
+    """Notifies the company inbox about a new contact form submission."""
+    msg_to_company = Message(
+        subject=f"New Contact Form Submission: {subject}",
+        recipients=[_RECEIVER_EMAIL],
+        sender=_DEFAULT_SENDER
+    )
+    msg_to_company.body = f"""
+Hello InGrowwth Innovations Team,
+
+You have received a new message from your website contact form:
+
+Name: {name}
+Email: {email}
+Subject: {subject}
+Message:
+{message}
+
+---
+This message was sent from your website.
+"""
+    try:
+        _send_mail(msg_to_company)
+        app.logger.info(f"Email sent to company ({_RECEIVER_EMAIL}) from {email}.")
+        return True
+    except Exception as e:
+        app.logger.error(f"Failed to send email to company: {e}")
+        return False
+
+
+# --- Background tasks ---
+# Messages are built inside the worker: a Flask-Mail Message is not picklable once bound to the app.
+# Explicit task names keep the web process and the worker in agreement however the module was imported.
+
+@celery.task(bind=True, name='send_career_reply_email', max_retries=MAIL_MAX_RETRIES)
+def send_career_reply_email_task(self, recipient, first_name, last_name, role_name):
+    with app.app_context():
+        if not send_career_reply_email(recipient, first_name, last_name, role_name):
+            raise self.retry(countdown=MAIL_RETRY_DELAY)
+
+
+@celery.task(bind=True, name='send_contact_reply_email', max_retries=MAIL_MAX_RETRIES)
+def send_contact_reply_email_task(self, recipient, name, subject):
+    with app.app_context():
+        if not send_contact_reply_email(recipient, name, subject):
+            raise self.retry(countdown=MAIL_RETRY_DELAY)
+
+
+@celery.task(bind=True, name='send_company_notification_email', max_retries=MAIL_MAX_RETRIES)
+def send_company_notification_email_task(self, name, email, subject, message):
+    with app.app_context():
+        if not send_company_notification_email(name, email, subject, message):
+            raise self.retry(countdown=MAIL_RETRY_DELAY)
+
+
+def _send_queued_email(func, args, attempt=0):
+    """Runs an email helper on the send queue, re-queueing it after a delay if it failed."""
+    with app.app_context():
+        sent = func(*args)
+    if not sent and attempt < MAIL_MAX_RETRIES:
+        # Wait on a timer rather than in the queue thread so other emails keep flowing
+        timer = threading.Timer(MAIL_RETRY_DELAY, _MAIL_POOL.submit, (_send_queued_email, func, args, attempt + 1))
+        timer.daemon = True
+        timer.start()
+
+
+def queue_email(task, func, *args):
+    """Hands an email off to Celery when a broker is configured, otherwise to the in-process send queue."""
+    if CELERY_BROKER_URL:
+        try:
+            task.delay(*args)
+            return
+        except Exception as e:
+            # The submission is already saved; a broker outage must not turn it into an error
+            app.logger.error(f"Failed to queue {task.name} on Celery, sending in-process instead: {e}")
+    _MAIL_POOL.submit(_send_queued_email, func, args)
+
+
 # --- Routes ---
 
+@app.errorhandler(RequestEntityTooLarge)
+def handle_request_too_large(e):
+    return jsonify({
+        'success': False,
+        'message': f'Request is too large (maximum {MAX_UPLOAD_SIZE // (1024 * 1024)} MB).'
+    }), 413
+
 @app.route('/')
 def home():
     return "InGrowwth Innovations Backend is running!"
@@ -164,48 +443,21 @@ def submit_contact():
         if not all([name, email, subject, message]):
             return jsonify({'success': False, 'message': 'All required fields (Name, Email, Subject, Message) are missing.'}), 400
 
-        # Send email to company
-        if os.getenv('RECEIVER_EMAIL'):
-            msg_to_company = Message(
-                subject=f"New Contact Form Submission: {subject}",
-                recipients=[os.getenv('RECEIVER_EMAIL')],
-                sender=app.config['MAIL_DEFAULT_SENDER']
-            )
-            msg_to_company.body = f"""
-Hello InGrowwth Innovations Team,
-
-You have received a new message from your website contact form:
-
-Name: {name}
-Email: {email}
-Subject: {subject}
-Message:
-{message}
-
----
-This message was sent from your website.
-"""
-            try:
-                mail.send(msg_to_company)
-                app.logger.info(f"Email sent to company ({os.getenv('RECEIVER_EMAIL')}) from {email}.")
-            except Exception as e:
-                app.logger.error(f"Failed to send email to company: {e}")
-                # We can still send the client confirmation even if this fails
+        # Queue email to company
+        if _RECEIVER_EMAIL:
+            queue_email(send_company_notification_email_task, send_company_notification_email, name, email, subject, message)
         else:
             app.logger.info("Company email sending skipped: RECEIVER_EMAIL not configured.")
-        
-        # Send confirmation email to client
-        client_email_sent = send_contact_reply_email(email, name, subject)
 
-        # Determine overall success message
-        response_message = "Your inquiry has been submitted successfully!"
-        if client_email_sent:
-            response_message += " You'll receive a confirmation email shortly."
-        else:
-            response_message += " There was an issue sending a confirmation email, but we received your message and will contact you soon."
+        # Queue confirmation email to client
+        queue_email(send_contact_reply_email_task, send_contact_reply_email, email, name, subject)
+
+        response_message = "Your inquiry has been submitted successfully! You'll receive a confirmation email shortly."
 
         return jsonify({'success': True, 'message': response_message}), 200
 
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         app.logger.error(f"Error processing contact request: {e}")
         return jsonify({'success': False, 'message': f'An unexpected error occurred on the server: {str(e)}'}), 500
@@ -213,38 +465,49 @@ This message was sent from your website.
 @app.route('/submit_application', methods=['POST'])
 def submit_application():
     try:
+        # Oversized uploads never get here: MAX_CONTENT_LENGTH makes Werkzeug raise
+        # RequestEntityTooLarge before the body is parsed (see handle_request_too_large)
         # Use a dictionary to store form data
         data = request.form.to_dict()
         resume_file = request.files.get('resume')
 
         # Basic server-side validation
         required_fields = ['firstName', 'lastName', 'email', 'phone', 'workExp', 'applyingFor', 'github', 'linkedin']
-        if not all(field in data and data[field].strip() for field in required_fields):
+        if not all(data.get(field, '').strip() for field in required_fields):
             return jsonify({
                 'success': False,
                 'message': 'All required fields must be filled.'
             }), 400
 
         # Validate email and phone formats
-        if not re.match(r'^[^\s@]+@[^\s@]+\.[^\s@]{2,}$', data['email']):
+        if not _EMAIL_RE.match(data['email']):
             return jsonify({'success': False, 'message': 'Invalid email format.'}), 400
-        if not re.match(r'^[6-9]\d{9}$', data['phone']):
+        if not _PHONE_RE.match(data['phone']):
             return jsonify({'success': False, 'message': 'Invalid phone number format.'}), 400
 
         # Handle resume file upload
         if not resume_file or resume_file.filename == '':
             return jsonify({'success': False, 'message': 'Resume file is required.'}), 400
-        
-        filename = secure_filename(resume_file.filename)
-        # Create a unique filename to prevent conflicts
-        unique_filename = f"{uuid.uuid4()}-{filename}"
+
+        # Check the raw name: secure_filename drops non-ASCII characters, which can swallow the extension
+        stem, extension = os.path.splitext(resume_file.filename)
+        extension = extension.lower()
+        if extension not in ALLOWED_RESUME_EXTENSIONS:
+            return jsonify({'success': False, 'message': 'Resume must be a PDF, DOC or DOCX file.'}), 400
+        filename = (secure_filename(stem) or 'resume') + extension
+
+        # One UUID serves as both the application id and the unique resume filename prefix
+        application_id = uuid.uuid4().hex
+        unique_filename = application_id + '-' + filename
         resume_path = os.path.join(RESUMES_FOLDER, unique_filename)
-        resume_file.save(resume_path)
+        # Stream the upload straight to disk instead of buffering it in memory
+        with open(resume_path, 'wb', buffering=0) as out:
+            shutil.copyfileobj(resume_file.stream, out, length=UPLOAD_CHUNK_SIZE)
 
         # Prepare data for storage
         application_data = {
-            'id': str(uuid.uuid4()),
-            'date': datetime.now().isoformat(),
+            'id': application_id,
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'firstName': data.get('firstName'),
             'lastName': data.get('lastName'),
             'email': data.get('email'),
@@ -259,13 +522,17 @@ def submit_application():
         
         # Save to database file
         if not save_application_data(application_data):
+            # Don't leave an orphaned resume behind for an application we couldn't record
+            os.remove(resume_path)
             return jsonify({
                 'success': False,
                 'message': 'Failed to save application. Please try again later.'
             }), 500
 
-        # Send confirmation email (non-blocking) - Updated arguments
-        send_career_reply_email(
+        # Queue confirmation email (sent in the background)
+        queue_email(
+            send_career_reply_email_task,
+            send_career_reply_email,
             application_data['email'],
             application_data['firstName'],
             application_data['lastName'],
@@ -278,6 +545,8 @@ def submit_application():
             'message': 'Thank you for your application! We will review it and get back to you soon.'
         }), 200
 
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         app.logger.error(f"Application submission failed: {e}")
         return jsonify({
@@ -286,4 +555,4 @@ def submit_application():
         }), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    app.run(port=5000)
\ No newline at end of file